@@ -0,0 +1,35 @@
+"""
+N-dimensional ray tracer.
+The tracing modules only depend on NumPy; the matplotlib-based plotting functions are
+imported on first access so that importing the package stays cheap for worker processes.
+They are left out of __all__, so `from nd_ray_tracer import *` does not import matplotlib either.
+"""
+from .core import NDRayTracer, OccupancyGridObstacles, TraversalCheckpoint, round2
+from .occupancy import LogOddsParams, integrate_rays
+from .chunked_world import ChunkedOccupancyStore
+from .clearance import ClearanceField, InflatedObstacles, distance_transform
+from .packed_index import PackedObstacleIndex
+from . import primitives
+
+_PLOTTING_FUNCTIONS = ("plot_2d_trace_with_proper_front_cells", "plot_3d_trace_with_proper_front_cells")
+
+def __getattr__(name):
+    if name in _PLOTTING_FUNCTIONS:
+        from . import plotting
+        return getattr(plotting, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = [
+    "NDRayTracer",
+    "OccupancyGridObstacles",
+    "TraversalCheckpoint",
+    "round2",
+    "LogOddsParams",
+    "integrate_rays",
+    "ChunkedOccupancyStore",
+    "ClearanceField",
+    "InflatedObstacles",
+    "distance_transform",
+    "PackedObstacleIndex",
+    "primitives",
+]
@@ -0,0 +1,106 @@
+import os
+import numpy as np
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+class ChunkedOccupancyStore:
+    """
+    Sparse occupancy store for large, mostly empty worlds.
+    The world is split into fixed-size n-D chunks saved as .npy files in `directory`.
+    Chunks are loaded lazily on the first lookup that touches them and evicted in LRU order
+    once the loaded chunks exceed `memory_budget` bytes. Chunks without a file are empty and
+    are answered without loading or allocating anything.
+    Supports `cell in store`, so it can be passed as `obstacles` to NDRayTracer.traverse.
+    """
+
+    def __init__(self, directory: str, chunk_shape: Tuple[int, ...], memory_budget: int):
+        self.directory = directory
+        self.chunk_shape = tuple(int(s) for s in chunk_shape)
+        self.memory_budget = memory_budget
+        self.load_count = 0       # Number of chunks read from disk
+        self.eviction_count = 0   # Number of chunks dropped from memory
+
+        self._chunks = OrderedDict()  # Loaded chunks, least recently used first
+        self._memory_used = 0
+        self._stored_keys = set()     # Chunks that have a file on disk, i.e. are not empty
+
+        os.makedirs(directory, exist_ok=True)
+        for name in os.listdir(directory):
+            if name.startswith("chunk_") and name.endswith(".npy"):
+                self._stored_keys.add(tuple(int(c) for c in name[len("chunk_"):-len(".npy")].split("_")))
+
+    def _chunk_path(self, key: Tuple[int, ...]) -> str:
+        return os.path.join(self.directory, "chunk_" + "_".join(str(c) for c in key) + ".npy")
+
+    def chunk_key(self, cell) -> Tuple[int, ...]:
+        """
+        Returns the key of the chunk containing `cell`.
+        """
+        return tuple(int(c) // s for c, s in zip(cell, self.chunk_shape))
+
+    def save_chunk(self, key: Tuple[int, ...], occupancy: np.ndarray):
+        """
+        Writes the occupancy of one chunk to disk. An all-free chunk is stored as no file at all.
+        """
+        occupancy = np.asarray(occupancy, dtype=bool)
+        if occupancy.shape != self.chunk_shape:
+            raise ValueError(f"chunk occupancy must have shape {self.chunk_shape}")
+
+        key = tuple(int(c) for c in key)
+        self._drop(key)
+        path = self._chunk_path(key)
+        if occupancy.any():
+            np.save(path, occupancy)
+            self._stored_keys.add(key)
+        else:
+            if os.path.exists(path):
+                os.remove(path)
+            self._stored_keys.discard(key)
+
+    def _drop(self, key: Tuple[int, ...]):
+        chunk = self._chunks.pop(key, None)
+        if chunk is not None:
+            self._memory_used -= chunk.nbytes
+
+    def _get_chunk(self, key: Tuple[int, ...]) -> Optional[np.ndarray]:
+        """
+        Returns the loaded chunk for `key`, paging it in if needed, or None if the chunk is empty.
+        """
+        if key not in self._stored_keys:
+            return None
+
+        chunk = self._chunks.get(key)
+        if chunk is not None:
+            self._chunks.move_to_end(key)
+            return chunk
+
+        chunk = np.load(self._chunk_path(key))
+        self.load_count += 1
+        self._chunks[key] = chunk
+        self._memory_used += chunk.nbytes
+
+        # Evict least recently used chunks, but always keep the one just loaded
+        while self._memory_used > self.memory_budget and len(self._chunks) > 1:
+            _, evicted = self._chunks.popitem(last=False)
+            self._memory_used -= evicted.nbytes
+            self.eviction_count += 1
+        return chunk
+
+    def __contains__(self, cell) -> bool:
+        key = self.chunk_key(cell)
+        chunk = self._get_chunk(key)
+        if chunk is None:
+            return False
+        local = tuple(int(c) - k * s for c, k, s in zip(cell, key, self.chunk_shape))
+        return bool(chunk[local])
+
+    def __bool__(self) -> bool:
+        return bool(self._stored_keys)
+
+    @property
+    def loaded_chunks(self) -> int:
+        return len(self._chunks)
+
+    @property
+    def memory_used(self) -> int:
+        return self._memory_used
@@ -0,0 +1,129 @@
+import numpy as np
+from typing import List, Tuple
+
+def _distance_pass(f: np.ndarray, axis: int, window: int, metric: str) -> np.ndarray:
+    """
+    One separable pass of the distance transform along `axis`, looking at most `window` cells away.
+    A cell d cells away along the axis is |d| - 0.5 away from the centre of the current cell.
+    Euclidean passes work on squared distances: g(x) = min_d f(x - d) + (|d| - 0.5)^2.
+    Chebyshev passes: g(x) = min_d max(f(x - d), |d| - 0.5).
+    """
+    g = f.copy()
+    n = f.ndim
+    for d in range(1, min(window, f.shape[axis] - 1) + 1):
+        gap = d - 0.5
+        cost = gap * gap if metric == "euclidean" else gap
+        head = tuple(slice(d, None) if i == axis else slice(None) for i in range(n))
+        tail = tuple(slice(None, -d) if i == axis else slice(None) for i in range(n))
+        for dst, src in ((head, tail), (tail, head)):
+            if metric == "euclidean":
+                candidate = f[src] + cost
+            else:
+                candidate = np.maximum(f[src], cost)
+            np.minimum(g[dst], candidate, out=g[dst])
+    return g
+
+def distance_transform(occupancy: np.ndarray, max_distance: float, metric: str = "euclidean") -> np.ndarray:
+    """
+    Distance from each cell centre to the nearest point of an occupied cell, in cell units,
+    truncated at max_distance. Occupied cells have distance 0 and free cells at least 0.5;
+    cells outside the grid count as free.
+    """
+    if metric not in ("euclidean", "chebyshev"):
+        raise ValueError("metric must be 'euclidean' or 'chebyshev'")
+
+    window = int(np.ceil(max_distance + 0.5))
+    f = np.where(occupancy, 0.0, float('inf'))
+    for axis in range(occupancy.ndim):
+        f = _distance_pass(f, axis, window, metric)
+    if metric == "euclidean":
+        f = np.sqrt(f)
+    return np.minimum(f, max_distance)
+
+class InflatedObstacles:
+    """
+    Obstacle view of a ClearanceField for an agent of a given radius.
+    A cell is an obstacle if it is occupied or an agent centred in it would overlap an occupied
+    cell, i.e. its clearance is below the radius (both in cell units). Cells outside the grid are free.
+    Supports `cell in obstacles`, so it can be passed as `obstacles` to NDRayTracer.traverse.
+    """
+
+    def __init__(self, field: "ClearanceField", radius: float):
+        self.field = field
+        self.radius = radius
+
+    def __contains__(self, cell) -> bool:
+        clearance = self.field.clearance
+        if any(c < 0 or c >= s for c, s in zip(cell, clearance.shape)):
+            return False
+        value = clearance[tuple(cell)]
+        return bool(value < self.radius or value == 0)
+
+    def __bool__(self) -> bool:
+        # Occupied cells are always obstacles; without one every clearance is max_clearance >= radius
+        return self.field.has_obstacles
+
+class ClearanceField:
+    """
+    Precomputed clearance of every cell of an occupancy grid: the distance from the cell centre
+    to the nearest point of an occupied cell, as computed by distance_transform.
+    Distances are truncated at max_clearance, which bounds the agent radius that can be queried
+    and lets obstacle changes be patched into the field locally.
+    """
+
+    def __init__(self, occupancy: np.ndarray, max_clearance: float, metric: str = "euclidean"):
+        self.occupancy = np.array(occupancy, dtype=bool)
+        self.max_clearance = max_clearance
+        self.metric = metric
+        self.clearance = distance_transform(self.occupancy, max_clearance, metric)
+        self._occupied_count = int(np.count_nonzero(self.occupancy))
+
+    @property
+    def has_obstacles(self) -> bool:
+        return self._occupied_count > 0
+
+    def inflated(self, radius: float) -> InflatedObstacles:
+        """
+        Returns the obstacles seen by an agent of the given radius.
+        """
+        if radius < 0 or radius > self.max_clearance:
+            raise ValueError("radius must be between 0 and max_clearance")
+        return InflatedObstacles(self, radius)
+
+    def update(self, cells: List[np.ndarray], occupied: bool = True):
+        """
+        Marks cells as occupied (or free) and rebuilds the clearance around them.
+        Only cells within max_clearance of a changed cell can change, and they only depend on
+        obstacles within max_clearance of themselves, i.e. at most max_clearance + 0.5 cells away
+        along each axis. The transform is recomputed on the bounding box of the changes grown by
+        twice that reach and copied back on the part grown by the reach once.
+        """
+        cells = np.array(cells, dtype=int).reshape(-1, self.occupancy.ndim)
+        if not len(cells):
+            return
+        shape = np.array(self.occupancy.shape)
+        if np.any((cells < 0) | (cells >= shape)):
+            raise ValueError("cells must lie inside the grid")
+
+        # Only cells whose state actually flips affect the clearance
+        changed = np.unique(cells, axis=0)
+        changed = changed[self.occupancy[tuple(changed.T)] != occupied]
+        if not len(changed):
+            return
+        self._occupied_count += len(changed) if occupied else -len(changed)
+        self.occupancy[tuple(changed.T)] = occupied
+
+        reach = int(np.ceil(self.max_clearance + 0.5))
+        inner_lo, inner_hi = self._grow(changed.min(axis=0), changed.max(axis=0) + 1, reach)
+        outer_lo, outer_hi = self._grow(changed.min(axis=0), changed.max(axis=0) + 1, 2 * reach)
+
+        outer = tuple(slice(lo, hi) for lo, hi in zip(outer_lo, outer_hi))
+        local = distance_transform(self.occupancy[outer], self.max_clearance, self.metric)
+
+        inner = tuple(slice(lo, hi) for lo, hi in zip(inner_lo, inner_hi))
+        inner_local = tuple(slice(lo - o, hi - o) for lo, hi, o in zip(inner_lo, inner_hi, outer_lo))
+        self.clearance[inner] = local[inner_local]
+
+    def _grow(self, lo: np.ndarray, hi: np.ndarray, margin: int) -> Tuple[np.ndarray, np.ndarray]:
+        shape = np.array(self.occupancy.shape)
+        return np.maximum(lo - margin, 0), np.minimum(hi + margin, shape)
@@ -0,0 +1,720 @@
+import numpy as np
+import itertools
+import time
+from typing import List, Tuple, Optional, Dict, Any, NamedTuple
+from .packed_index import PackedObstacleIndex
+
+def round2(x):
+    """
+    Rounds a float, int, or numpy array to 2 decimal places.
+    """
+    if isinstance(x, (float, int)):
+        return round(x, 2)
+    elif isinstance(x, np.ndarray):
+        return np.round(x, 2)
+    elif isinstance(x, list):
+        return [round2(i) for i in x]
+    else:
+        return x
+
+class OccupancyGridObstacles:
+    """
+    Obstacle lookup over a dense occupancy grid, where grid[cell] != 0 marks an obstacle (as in
+    NDRayTracer.cast_fan), so boolean and integer grids both work. Cells outside the grid are free.
+    """
+
+    def __init__(self, grid: np.ndarray):
+        self.grid = grid
+        self._has_obstacles = bool(grid.any())  # Checked once, traversals build the lookup once per call
+
+    def __contains__(self, cell) -> bool:
+        if any(c < 0 or c >= s for c, s in zip(cell, self.grid.shape)):
+            return False
+        return bool(self.grid[tuple(cell)] != 0)
+
+    def contains_cells(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each row of `cells` that is an obstacle.
+        """
+        in_bounds = np.all((cells >= 0) & (cells < np.array(self.grid.shape)), axis=1)
+        result = np.zeros(len(cells), dtype=bool)
+        result[in_bounds] = self.grid[tuple(cells[in_bounds].T)] != 0
+        return result
+
+    def __bool__(self) -> bool:
+        return self._has_obstacles
+
+class TraversalCheckpoint(NamedTuple):
+    """
+    State of a traversal paused by NDRayTracer.traverse_budgeted.
+    Only the dynamic state (t, k, D, y, l, prev_front_cell_status) is copied. The result lists are
+    shared with the traversal and only appended to, so pausing and resuming cost O(n), not O(steps).
+    If a list has grown past its length at the pause (the checkpoint was already resumed), resuming
+    works on a copy of its first result_lengths entries, so earlier results are never changed.
+    """
+    x_0: np.ndarray
+    x_f: np.ndarray
+    t: int
+    k: np.ndarray
+    D: np.ndarray
+    y: np.ndarray
+    l: float
+    prev_front_cell_status: np.ndarray
+    path: List[np.ndarray]                  # Results gathered so far, shared
+    front_cells: List[List[np.ndarray]]
+    intersection_coords: List[np.ndarray]
+    y_coords_history: List[np.ndarray]
+    result_lengths: Tuple[int, int, int, int]  # Lengths of the four lists above at the pause
+
+class NDRayTracer:
+    """
+    N-Dimensional Ray Tracer with corrected front cell implementation
+    Each method and variable corresponds to sections in raytracer.pdf
+    """
+    
+    def __init__(self):
+        self.x_0 = None          # 1. Starting coordinates 
+        self.delta_x = None      # 2. Δx, Difference between goal and start coordinates, 
+        self.abs_delta_x = None  # 3. |Δx|, absolute value of Δx  
+        self.norm_delta_x = None # 4. ||Δx||,  total length of ray, 
+        self.delta_x_sign = None # 5. Vector of Sign, direction ray is cast, δx signum
+        self.k = None            # 6. Vector of number of times ray crossed grid hyperplane aka counters of |Δx| in different dimensions
+        self.D = None            # 7. Vector of distance of current point to the start for each hyperplace cross
+        self.D_0 = None          # 8. Initial D values
+        self.y = None            # 9. Current corner coordinates from which front cells derived
+        self.F = None            # 10.Vector of relative coordinates of front cells
+        self.l = 0               # 11. Total Length of ray
+        self.t = 0               # Current step
+        self.n = 0               # Number of dimensions
+        self.y_coords_history = []  # History of y coordinates for each step
+
+        self.prev_front_cell_status = None
+        self.current_front_cell_status = None
+        self._dims_to_change = {}  # Combinations of dimensions a DFS move may change, per (n, loose_dimension)
+
+    def init(self, x_0: np.ndarray, x_f: np.ndarray):
+        """
+        Initialization function as described in PDF section "The steps for init(x_s, x_f)"
+        """
+        self.x_0 = np.array(x_0, dtype=float)
+        x_f = np.array(x_f, dtype=float)
+        self.n = len(x_0)
+        self.t = 0
+        
+        # Step 1: Δx = x_f - x_s
+        self.delta_x = x_f - self.x_0
+
+        # Step 2: Calculate |Δx|
+        self.abs_delta_x = np.abs(self.delta_x)
+        
+        # Step 3: Calculate δx (sign vector)
+        self.delta_x_sign = np.array([self._sign(dx) for dx in self.delta_x])
+        
+        # Step 4: l^(0) = 0
+        self.l = 0
+        
+        # Step 5: k^(0) = 0 vector
+        self.k = np.zeros(self.n, dtype=int)
+        
+        # Step 6: Calculate D_i^(0) based on PDF formula
+        self.norm_delta_x = np.linalg.norm(self.delta_x)  # ||Δx||
+        # Step 7: y^(0) = [x_0 | -Δx] (conditional floor/ceiling)
+        self.y = self._floor_ceil_conditional(self.x_0, -self.delta_x).astype(int)
+        self.y_coords_history.append(self.y.copy())  # Initialize history with the first y value
+        # Step 8: Determine F - front cells matrix
+        self._determine_front_cells()
+        self.prev_front_cell_status = np.ones(len(self.F), dtype=int)
+           # Calculate return values at the end
+
+        all_front_cells = [self.front_cells()]
+
+        self.D = np.zeros(self.n)
+        self.D_0 = np.zeros(self.n)
+        self.frontCellsInit = []
+        self.init_coords = []
+        for i in range(self.n):
+            if self.delta_x[i] < 0:
+                # (⌊x_{s,i}⌋ - x_{s,i}) / Δx_i when Δx_i < 0
+                self.D[i] = (np.floor(self.x_0[i]) - self.x_0[i]) / self.delta_x[i]
+            elif abs(self.delta_x[i]) < 1e-10:
+                # ∞ when Δx_i = 0
+                self.D[i] = float('inf')
+            else: # self.delta_x[i] > 0
+                # (⌈x_{s,i}⌉ - x_{s,i}) / Δx_i when Δx_i > 0
+                self.D[i] = (np.ceil(self.x_0[i]) - self.x_0[i]) / self.delta_x[i]
+
+            # If starting on a grid line, D[i] will be 0 or very close to it.
+            # The next intersection should be one full grid cell away.
+            if abs(self.D[i]) < 1e-9 and abs(self.delta_x[i]) > 1e-9:
+                self.D[i] = 1.0 / abs(self.delta_x[i])
+        self.D_0 = self.D.copy()
+        
+        all_front_cells.extend(self.frontCellsInit)
+        current_front_cells = all_front_cells
+        current_coords =  self.init_coords
+        current_length = self.length()
+        goal_reached = self.reached()
+
+        return {
+            "front_cells": current_front_cells,
+            "last_coordinates": current_coords,
+            "length_traversed": current_length,
+            "reached_goal": goal_reached
+        }
+        
+    def _floor_ceil_conditional(self, a: np.ndarray, b: np.ndarray) -> np.ndarray:
+        """
+        PDF operator 3: c = [a | b] - elementwise ceiling or flooring
+        depending on element in b at same position
+        """
+        result = np.zeros_like(a)
+        for i in range(len(a)):
+            if b[i] <= 0:
+                result[i] = np.floor(a[i])
+            else:
+                result[i] = np.ceil(a[i])
+        return result
+    
+    def _sign(self, x: float) -> int:
+        """
+        Sign function as defined in PDF variable 5
+        """
+        if x > 0:
+            return 1
+        elif x == 0:
+            return 0
+        else:
+            return -1
+    
+
+
+    def _determine_front_cells(self):
+        """
+        Determines front cells using a recursive approach.
+        """
+        self.F_list = []
+        self._determine_front_cells_recursive(0, np.zeros(self.n, dtype=int))
+        self.F = np.array(self.F_list)
+
+    def _determine_front_cells_recursive(self, dim, current_f):
+        if dim == self.n:
+            self.F_list.append(current_f.copy())
+            return
+
+        is_delta_x_zero = abs(self.delta_x[dim]) < 1e-10
+        is_x0_integer = abs(self.x_0[dim] - round(self.x_0[dim])) < 1e-10
+
+        if is_delta_x_zero and is_x0_integer:
+            # Branch for h = -1
+            current_f[dim] = -1
+            self._determine_front_cells_recursive(dim + 1, current_f)
+            
+            # Branch for h = 1 (which maps to f = 0)
+            current_f[dim] = 0
+            self._determine_front_cells_recursive(dim + 1, current_f)
+        else:
+            if self.delta_x_sign[dim] < 0:
+                current_f[dim] = -1
+            else:
+                current_f[dim] = 0
+            self._determine_front_cells_recursive(dim + 1, current_f)
+
+    def coords(self) -> np.ndarray:
+        """
+        PDF Dynamic function 1: Returns current intercept coordinates
+        x^(t) = x_0 + (l^(t) / ||Δx||) * Δx
+        """
+        if self.norm_delta_x == 0:
+            return self.x_0.copy()
+        return self.x_0 + (self.l / self.norm_delta_x) * self.delta_x
+    
+    def front_cells(self) -> List[np.ndarray]:
+        """
+        PDF Dynamic function 2: Returns coordinates of front cells
+        These are the cells that the ray will enter next from current position
+        """
+        cells = []
+        for f_j in self.F:
+            cell_coord = self.y + f_j
+            cells.append(cell_coord)
+        return cells
+    
+    def length(self) -> float:
+        """
+        PDF Dynamic function 3: Returns current length travelled
+        """
+        return self.l
+    
+    def reached(self) -> bool:
+        """
+        PDF Dynamic function 4: Returns true if ray reached goal
+        True if min D_i^(t) >= 1
+        """
+        return np.min(self.D) >= 1.0
+    
+
+
+    def _key_deltas_towards(self, end_key: int, components: np.ndarray, loose_dimension: int) -> List[List[int]]:
+        """
+        Precomputes, for every search space cell, the key deltas that move it towards the end cell.
+        components[key] holds the key's component along each dimension. A move changes between 1 and
+        loose_dimension of the dimensions in which the cell differs from the end cell; moves that
+        would change a dimension that already matches get delta 0, which leads back to the cell itself.
+        """
+
+             #loose dimension cannot be zero and must be less than or equal the number of dimensions
+        if loose_dimension <= 0 or loose_dimension > self.n:
+            raise ValueError("loose_dimension must be between 1 and the number of dimensions (inclusive)")
+
+        # One row per combination of dimensions to change, 1 for each dimension in the combination
+        dims_to_change = self._dims_to_change.get((self.n, loose_dimension))
+        if dims_to_change is None:
+            combinations = [dims for i in range(1, loose_dimension + 1) for dims in itertools.combinations(range(self.n), i)]
+            dims_to_change = np.zeros((len(combinations), self.n), dtype=int)
+            for j, dims in enumerate(combinations):
+                dims_to_change[j, list(dims)] = 1
+            self._dims_to_change[(self.n, loose_dimension)] = dims_to_change
+
+        diff = components[end_key] - components
+        unchanged_dims = (diff == 0).astype(int) @ dims_to_change.T
+        return np.where(unchanged_dims == 0, diff @ dims_to_change.T, 0).tolist()
+
+    def _dfs_get_traced_keys(self, start_key: int, end_keys: set, free: List[bool], key_deltas: Dict[int, List[List[int]]], components: np.ndarray, loose_dimension: int) -> set:
+        """
+        Performs a Depth-First Search to find all reachable cells from a start cell.
+        Cells are search space keys and free[key] is False for obstacles. key_deltas caches, per end
+        cell, the precomputed key deltas of every cell towards it, so neighbors are found with integer
+        additions only.
+        Returns the set of all visited keys.
+        """
+        if not free[start_key]:
+            return set()
+
+        stack = [start_key]
+        visited = {start_key}
+
+        while stack:
+            current_key = stack.pop()
+
+            # Generate neighbors by trying to move towards each end cell
+            for end_key in end_keys:
+                if current_key == end_key:
+                    continue
+
+                if end_key not in key_deltas:
+                    key_deltas[end_key] = self._key_deltas_towards(end_key, components, loose_dimension)
+
+                for delta in key_deltas[end_key][current_key]:
+                    neighbor = current_key + delta
+
+                    if free[neighbor] and neighbor not in visited:
+                        visited.add(neighbor)
+                        stack.append(neighbor)
+
+        return visited
+
+    def _as_obstacle_lookup(self, obstacles: Any, n: int) -> Optional[Any]:
+        """
+        Returns a container answering `cell in lookup` for cell tuples, or None if there are no obstacles.
+        A list (or (N, n) array) of obstacle cells becomes a PackedObstacleIndex, or a set of tuples if
+        the cells do not fit its keys; a boolean array, or any other n-D array, is an occupancy grid and
+        is wrapped in an OccupancyGridObstacles; any other container (e.g. a set of tuples or a
+        ChunkedOccupancyStore) is used as is. n is the dimension of the ray. A 2-D non-boolean
+        grid with two columns reads as a cell array, wrap it in OccupancyGridObstacles instead.
+        """
+        if isinstance(obstacles, np.ndarray) and (obstacles.dtype == bool or not (obstacles.ndim == 2 and obstacles.shape[1] == n)):
+            if obstacles.ndim != n:
+                raise ValueError(f"obstacles array of shape {obstacles.shape} is neither an (N, {n}) array of cells "
+                                 f"nor a {n}-D occupancy grid")
+            obstacles = OccupancyGridObstacles(obstacles)
+        elif isinstance(obstacles, (list, tuple, np.ndarray)):
+            if len(obstacles) == 0:
+                return None
+            try:
+                obstacles = PackedObstacleIndex(obstacles, len(obstacles[0]))
+            except ValueError:
+                obstacles = {tuple(obs) for obs in obstacles}
+        if not obstacles:
+            return None
+        return obstacles
+
+    def _contains_cells(self, obstacles: Any, cells: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each row of `cells` that is an obstacle, in one vectorized lookup when supported.
+        """
+        if hasattr(obstacles, "contains_cells"):
+            return np.asarray(obstacles.contains_cells(cells), dtype=bool)
+        return np.array([tuple(cell) in obstacles for cell in cells.tolist()], dtype=bool)
+
+    def isHitObstacle(self, prev_front_cells: List[np.ndarray], current_front_cells: List[np.ndarray], obstacles: Optional[Any], loose_dimension: int = 0) -> bool:
+        front_cells = prev_front_cells + current_front_cells
+        n = len(front_cells[0]) if front_cells else self.n
+        return self._is_hit_obstacle_lookup(prev_front_cells, current_front_cells, self._as_obstacle_lookup(obstacles, n), loose_dimension)
+
+    def _is_hit_obstacle_lookup(self, prev_front_cells: List[np.ndarray], current_front_cells: List[np.ndarray], obstacle_lookup: Optional[Any], loose_dimension: int) -> bool:
+        """
+        isHitObstacle on obstacles already normalized by _as_obstacle_lookup, so traversals
+        build the lookup once instead of on every step.
+        """
+        if obstacle_lookup is None:
+            return False
+
+        # Search space: bounding box of all front cells, with cells numbered by a row-major linear key
+        all_f_cells = np.vstack(prev_front_cells + current_front_cells).astype(int)
+        min_coords = np.min(all_f_cells, axis=0)
+        extent = np.max(all_f_cells, axis=0) - min_coords + 1
+        strides = np.append(np.cumprod(extent[:0:-1])[::-1], 1)
+        search_space_cells = min_coords + np.indices(extent).reshape(len(extent), -1).T
+
+        free = (~self._contains_cells(obstacle_lookup, search_space_cells)).tolist()
+        components = (search_space_cells - min_coords) * strides
+        key_deltas = {}  # Filled per end cell on first use and shared by every DFS of this call
+
+        _prev_front_keys = ((np.array(prev_front_cells, dtype=int) - min_coords) @ strides).tolist()
+        _current_front_keys = ((np.array(current_front_cells, dtype=int) - min_coords) @ strides).tolist()
+        _current_front_keys_set = set(_current_front_keys)
+
+        self.current_front_cell_status = np.zeros(len(_current_front_keys), dtype=int)
+
+        for i, start_key in enumerate(_prev_front_keys):
+            if self.prev_front_cell_status[i] == 1:
+                traced_keys = self._dfs_get_traced_keys(start_key, _current_front_keys_set, free, key_deltas, components, loose_dimension)
+
+                for j, c_key in enumerate(_current_front_keys):
+                    if c_key in traced_keys:
+                        self.current_front_cell_status[j] = 1
+        
+        obstacle_hit = np.sum(self.current_front_cell_status) == 0
+        if not obstacle_hit:
+            self.prev_front_cell_status = self.current_front_cell_status.copy()
+        return obstacle_hit
+    
+    def next(self) -> Dict[str, Any]:
+        """
+        Advances the ray to the next grid intersection and updates its state.
+        """
+        min_D_value = np.min(self.D)
+        i_star_indices = np.where(self.D == min_D_value)[0]
+        
+        for i_star in i_star_indices:
+            self.k[i_star] += 1
+        
+        self.l = min_D_value * self.norm_delta_x
+    
+        for i_star in i_star_indices:
+            if abs(self.delta_x[i_star]) > 1e-10:
+                self.D[i_star] = self.D_0[i_star] + (self.k[i_star] / abs(self.delta_x[i_star]))
+            else:
+                self.D[i_star] = float('inf')
+
+        for i_star in i_star_indices:
+            self.y[i_star] += self.delta_x_sign[i_star]
+
+        self.t += 1
+        self._determine_front_cells()
+
+        return {
+            "front_cells": self.front_cells(),
+            "last_coordinates": self.coords(),
+            "length_traversed": self.length(),
+            "reached_goal": self.reached()
+        }
+
+    def traverse(self, x_0: np.ndarray, x_f: np.ndarray, obstacles: Optional[Any] = None, loose_dimension: int = 0) -> Tuple[List[np.ndarray], List[List[np.ndarray]], List[np.ndarray], List[np.ndarray], bool, bool]:
+        """
+        Complete traversal with corrected front cell tracking.
+        obstacles is a list or (N, n) array of obstacle cells, an n-D occupancy grid where nonzero cells
+        are obstacles (e.g. built with nd_ray_tracer.primitives) or any container supporting `cell in obstacles`.
+        Returns: (path_coordinates, front_cells_at_each_step, intersection_coordinates, y_coords_history, obstacle_hit, goal_reached)
+        """
+        result, _ = self.traverse_budgeted(x_0, x_f, obstacles, loose_dimension=loose_dimension)
+        return result
+
+    def traverse_budgeted(self, x_0: np.ndarray, x_f: np.ndarray, obstacles: Optional[Any] = None, loose_dimension: int = 0,
+                          max_steps: Optional[int] = None, deadline: Optional[float] = None,
+                          checkpoint: Optional[TraversalCheckpoint] = None) -> Tuple[Optional[Tuple], Optional[TraversalCheckpoint]]:
+        """
+        Traversal that stops after max_steps calls to next() or once time.monotonic() passes deadline.
+        Returns (result, None) when the traversal finished, with result as returned by traverse,
+        or (None, checkpoint) when the budget ran out. Passing the checkpoint back (with the same
+        obstacles) resumes the traversal, on this or another tracer, with identical results.
+        x_0 and x_f are ignored when resuming. A checkpoint can be resumed more than once; results
+        returned by an earlier resume are left unchanged.
+        """
+        obstacles = self._as_obstacle_lookup(obstacles, len(checkpoint.x_0 if checkpoint is not None else x_0))
+
+        if checkpoint is not None:
+            x_f = checkpoint.x_f
+            path, all_front_cells, intersection_coords = self._restore(checkpoint)
+        else:
+            step_info = self.init(x_0, x_f)
+            path = [self.x_0.copy()]
+            all_front_cells = [self.front_cells()]
+            initial_front_cells = all_front_cells[-1]
+
+            if np.all(np.abs(self.x_0 - np.round(self.x_0)) < 1e-10):
+                intersection_coords = [self.x_0.copy()]
+            else:
+                all_front_cells = step_info['front_cells']
+                intersection_coords = [self.x_0.copy()]
+                if 'last_coordinates' in step_info and step_info['last_coordinates']:
+                    path.extend(step_info['last_coordinates'])
+                    intersection_coords.extend(step_info['last_coordinates'])
+
+            if self._is_hit_obstacle_lookup(initial_front_cells, initial_front_cells, obstacles, loose_dimension):
+                return (path, all_front_cells, intersection_coords, self.y_coords_history, True, False), None
+
+            if np.array_equal(self.x_0, x_f):
+                return (path, all_front_cells, intersection_coords, self.y_coords_history, False, True), None
+
+        isGoalReached = False
+        obstacle_hit = False
+        steps = 0
+
+        while not self.reached():
+            if (max_steps is not None and steps >= max_steps) or (deadline is not None and time.monotonic() >= deadline):
+                return None, self._checkpoint(x_f, path, all_front_cells, intersection_coords)
+
+            prev_front_cells = all_front_cells[-1]
+            step_info = self.next()
+            steps += 1
+            new_front_cells = step_info["front_cells"]
+            
+            path.append(step_info["last_coordinates"].copy())
+            intersection_coords.append(step_info["last_coordinates"].copy())
+            self.y_coords_history.append(self.y.copy())
+            
+            if self._is_hit_obstacle_lookup(prev_front_cells, new_front_cells, obstacles, loose_dimension):
+                obstacle_hit = True
+                break
+            
+            all_front_cells.append(new_front_cells)
+
+        if not obstacle_hit:
+            if not path or not np.array_equal(path[-1], x_f):
+                path.append(x_f.copy())
+            isGoalReached = True
+
+        return (path, all_front_cells, intersection_coords, self.y_coords_history, obstacle_hit, isGoalReached), None
+
+    def _checkpoint(self, x_f: np.ndarray, path: List[np.ndarray], all_front_cells: List[List[np.ndarray]], intersection_coords: List[np.ndarray]) -> TraversalCheckpoint:
+        return TraversalCheckpoint(
+            x_0=self.x_0.copy(),
+            x_f=x_f,
+            t=self.t,
+            k=self.k.copy(),
+            D=self.D.copy(),
+            y=self.y.copy(),
+            l=self.l,
+            prev_front_cell_status=self.prev_front_cell_status.copy(),
+            path=path,
+            front_cells=all_front_cells,
+            intersection_coords=intersection_coords,
+            y_coords_history=self.y_coords_history,
+            result_lengths=(len(path), len(all_front_cells), len(intersection_coords), len(self.y_coords_history)),
+        )
+
+    def _restore(self, checkpoint: TraversalCheckpoint) -> Tuple[List[np.ndarray], List[List[np.ndarray]], List[np.ndarray]]:
+        """
+        Restores the tracer from a checkpoint. The values derived from x_0 and x_f (Δx, δx, D_0, ...)
+        are recomputed by init and the dynamic state is copied back. The shared result lists are
+        continued in place, unless they grew after the pause, in which case they are forked.
+        """
+        self.y_coords_history = []  # init appends here, keep it off the shared history
+        self.init(checkpoint.x_0, checkpoint.x_f)
+        self.t = checkpoint.t
+        self.k = checkpoint.k.copy()
+        self.D = checkpoint.D.copy()
+        self.y = checkpoint.y.copy()
+        self.l = checkpoint.l
+        self.prev_front_cell_status = checkpoint.prev_front_cell_status.copy()
+        self._determine_front_cells()
+
+        results = (checkpoint.path, checkpoint.front_cells, checkpoint.intersection_coords, checkpoint.y_coords_history)
+        path, all_front_cells, intersection_coords, self.y_coords_history = [
+            result if len(result) == length else result[:length]
+            for result, length in zip(results, checkpoint.result_lengths)
+        ]
+        return path, all_front_cells, intersection_coords
+
+    def traverse_with_clearance(self, x_0: np.ndarray, x_f: np.ndarray, clearance_field: Any, radius: float, loose_dimension: int = 0) -> Tuple[List[np.ndarray], List[List[np.ndarray]], List[np.ndarray], List[np.ndarray], bool, bool]:
+        """
+        Traversal for an agent of nonzero radius.
+        Each front cell is rejected with one lookup into the precomputed clearance of `clearance_field`
+        (a ClearanceField) instead of inflating the obstacle list or tracing parallel rays.
+        Returns the same tuple as traverse.
+        """
+        return self.traverse(x_0, x_f, clearance_field.inflated(radius), loose_dimension=loose_dimension)
+
+    def _init_batch(self, x_0: np.ndarray, delta_x: np.ndarray) -> Dict[str, Any]:
+        """
+        Vectorized init(x_s, x_f) for a batch of rays.
+        x_0 is either one shared origin of shape (n,) or one origin per ray of shape (R, n);
+        delta_x has shape (R, n). Everything that only depends on the origin is computed
+        on x_0 as given, so a shared origin is floored/ceiled once and broadcast.
+        """
+        x_0 = np.asarray(x_0, dtype=float)
+        delta_x = np.array(delta_x, dtype=float)
+        delta_x[np.abs(delta_x) < 1e-10] = 0.0
+
+        # Origin-dependent state
+        x_0_floor = np.floor(x_0)
+        x_0_ceil = np.ceil(x_0)
+        is_x0_integer = np.abs(x_0 - np.round(x_0)) < 1e-10
+
+        # Step 3: δx
+        delta_x_sign = np.sign(delta_x).astype(int)
+        abs_delta_x = np.abs(delta_x)
+
+        # Step 7: y^(0) = [x_0 | -Δx]
+        y = np.where(delta_x < 0, x_0_ceil, x_0_floor).astype(int)
+
+        # Step 8: F, with dimensions that have two front cells (Δx_i = 0 on a grid line) flagged
+        f_base = np.where(delta_x_sign < 0, -1, 0)
+        ambiguous = (delta_x_sign == 0) & is_x0_integer
+
+        # Step 6: D^(0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            D = np.where(delta_x < 0, (x_0_floor - x_0) / delta_x, (x_0_ceil - x_0) / delta_x)
+            D = np.where(delta_x == 0, float('inf'), D)
+            D = np.where((np.abs(D) < 1e-9) & (delta_x != 0), 1.0 / abs_delta_x, D)
+
+        return {
+            "delta_x": delta_x,
+            "abs_delta_x": abs_delta_x,
+            "delta_x_sign": delta_x_sign,
+            "norm_delta_x": np.linalg.norm(delta_x, axis=1),
+            "k": np.zeros(delta_x.shape, dtype=int),
+            "D": D,
+            "D_0": D.copy(),
+            "y": y,
+            "f_base": f_base,
+            "ambiguous": np.broadcast_to(ambiguous, delta_x.shape),
+        }
+
+    def _next_batch(self, state: Dict[str, Any], active: np.ndarray) -> np.ndarray:
+        """
+        Vectorized next() for the active rays of a batch.
+        Returns min D_i of each active ray before the step, i.e. where it crossed the grid.
+        """
+        D = state["D"][active]
+        min_D_value = np.min(D, axis=1)
+        i_star = D == min_D_value[:, None]
+
+        k = state["k"][active] + i_star
+        with np.errstate(divide='ignore', invalid='ignore'):
+            D_next = state["D_0"][active] + k / state["abs_delta_x"][active]
+        state["k"][active] = k
+        state["D"][active] = np.where(i_star, D_next, D)
+        state["y"][active] += i_star * state["delta_x_sign"][active]
+        return min_D_value
+
+    def _batch_front_cells_blocked(self, state: Dict[str, Any], rays: np.ndarray, grid: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each ray in `rays` whose front cells are all occupied in `grid`.
+        Cells outside the grid are free.
+        """
+        y = state["y"][rays]
+        f_base = state["f_base"][rays]
+        ambiguous = state["ambiguous"][rays]
+        shape = np.array(grid.shape)
+
+        blocked = np.ones(len(rays), dtype=bool)
+        ambiguous_dims = np.flatnonzero(ambiguous.any(axis=0))
+        for bits in itertools.product([False, True], repeat=len(ambiguous_dims)):
+            use_lower = np.zeros(self.n, dtype=bool)
+            use_lower[ambiguous_dims] = bits
+            cells = y + np.where(ambiguous & use_lower, -1, f_base)
+            in_bounds = np.all((cells >= 0) & (cells < shape), axis=1)
+            occupied = np.zeros(len(rays), dtype=bool)
+            occupied[in_bounds] = grid[tuple(cells[in_bounds].T)] != 0
+            blocked &= occupied
+        return blocked
+
+    def _batch_left_grid(self, state: Dict[str, Any], rays: np.ndarray, grid_shape: Tuple[int, ...]) -> np.ndarray:
+        """
+        Returns True for each ray in `rays` that is outside the grid and moving away from it.
+        """
+        y = state["y"][rays]
+        sign = state["delta_x_sign"][rays]
+        lowest = y + np.where(state["ambiguous"][rays], -1, state["f_base"][rays])
+        highest = y + state["f_base"][rays]
+        below = (highest < 0) & (sign <= 0)
+        above = (lowest >= np.array(grid_shape)) & (sign >= 0)
+        return np.any(below | above, axis=1)
+
+    def cast_fan(self, origin: np.ndarray, directions: np.ndarray, max_range: float, grid: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Casts a fan of rays from one origin through an occupancy grid, e.g. for sensor sweeps.
+        The origin-dependent part of init (floor/ceiling of x_0 and its grid-line test) is
+        computed once and all rays are stepped together as a vectorized batch.
+        Each ray is cut at max_range instead of a goal point.
+        grid[cell] != 0 marks an obstacle; cells outside the grid are free.
+        A ray stops once all of its front cells are occupied, so it can pass between two
+        obstacles that only touch at a corner.
+        Returns: (hit_distances, hit_cells, hit) where misses have distance inf and cell -1.
+        """
+        origin = np.array(origin, dtype=float)
+        directions = np.atleast_2d(np.array(directions, dtype=float))
+        self.n = len(origin)
+        if directions.shape[1] != self.n:
+            raise ValueError("directions must have the same number of dimensions as origin")
+        if grid.ndim != self.n:
+            raise ValueError("grid must have the same number of dimensions as origin")
+
+        norms = np.linalg.norm(directions, axis=1)
+        if np.any(norms == 0):
+            raise ValueError("directions must be non-zero")
+        delta_x = directions / norms[:, None] * max_range
+
+        num_rays = len(directions)
+        state = self._init_batch(origin, delta_x)
+        hit = np.zeros(num_rays, dtype=bool)
+        hit_distances = np.full(num_rays, float('inf'))
+        hit_cells = np.full((num_rays, self.n), -1, dtype=int)
+
+        active = np.arange(num_rays)
+        min_D_value = np.zeros(num_rays)
+        while len(active):
+            blocked = self._batch_front_cells_blocked(state, active, grid)
+            hit_rays = active[blocked]
+            hit[hit_rays] = True
+            hit_distances[hit_rays] = min_D_value[blocked] * max_range
+            hit_cells[hit_rays] = state["y"][hit_rays] + state["f_base"][hit_rays]
+
+            active = active[~blocked]
+            active = active[~self._batch_left_grid(state, active, grid.shape)]
+            active = active[np.min(state["D"][active], axis=1) < 1.0]
+            if len(active):
+                min_D_value = self._next_batch(state, active)
+
+        return hit_distances, hit_cells, hit
+
+    def batch_traversed_cells(self, x_0: np.ndarray, x_f: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Steps a batch of rays from x_0 to x_f together and gathers the cells each one passes through.
+        x_0 is a shared origin of shape (n,) or one origin per ray; x_f has shape (R, n).
+        Returns: (ray_indices, cells, end_cells) where cells[j] is a cell ray ray_indices[j] left
+        before reaching its goal and end_cells[i] is the cell ray i ends in.
+        """
+        x_0 = np.array(x_0, dtype=float)
+        x_f = np.atleast_2d(np.array(x_f, dtype=float))
+        self.n = x_f.shape[1]
+
+        state = self._init_batch(x_0, x_f - x_0)
+        ray_indices = []
+        cells = []
+
+        active = np.arange(len(x_f))
+        while True:
+            active = active[np.min(state["D"][active], axis=1) < 1.0]
+            if not len(active):
+                break
+            ray_indices.append(active)
+            cells.append(state["y"][active] + state["f_base"][active])
+            self._next_batch(state, active)
+
+        end_cells = state["y"] + state["f_base"]
+        if not cells:
+            return np.zeros(0, dtype=int), np.zeros((0, self.n), dtype=int), end_cells
+        return np.concatenate(ray_indices), np.concatenate(cells), end_cells
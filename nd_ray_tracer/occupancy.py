@@ -0,0 +1,45 @@
+import numpy as np
+from typing import NamedTuple, Optional
+from .core import NDRayTracer
+
+class LogOddsParams(NamedTuple):
+    """
+    Log-odds increments applied per batch and the clamping bounds of the map.
+    """
+    free: float = -0.4       # Added to cells a ray passes through
+    occupied: float = 0.85   # Added to the cell a ray ends in
+    min: float = -2.0        # Lower clamping bound
+    max: float = 3.5         # Upper clamping bound
+
+def _flat_in_bounds(cells: np.ndarray, shape: tuple) -> np.ndarray:
+    """
+    Returns the flat grid indices of the cells that lie inside a grid of the given shape.
+    """
+    in_bounds = np.all((cells >= 0) & (cells < np.array(shape)), axis=1)
+    return np.ravel_multi_index(tuple(cells[in_bounds].T), shape)
+
+def integrate_rays(origins: np.ndarray, endpoints: np.ndarray, grid: np.ndarray, log_odds_params: Optional[LogOddsParams] = None) -> np.ndarray:
+    """
+    Integrates a batch of range measurements into a log-odds occupancy grid in place.
+    Every cell a ray passes through gets a free update and the cell it ends in gets an occupied update.
+    Each cell is updated at most once per batch, however many rays touch it; a cell that is
+    both passed through and ended in counts as occupied. Updated cells are clamped to [min, max].
+    origins is a shared origin of shape (n,) or one origin per ray; endpoints has shape (R, n).
+    Cells outside the grid are ignored. grid must have a floating point dtype. Returns the grid.
+    """
+    if not np.issubdtype(grid.dtype, np.floating):
+        raise TypeError(f"grid must have a floating point dtype to hold log-odds, got {grid.dtype}")
+    params = log_odds_params if log_odds_params is not None else LogOddsParams()
+
+    _, free_cells, end_cells = NDRayTracer().batch_traversed_cells(origins, endpoints)
+
+    occupied_idx = np.unique(_flat_in_bounds(end_cells, grid.shape))
+    free_idx = np.setdiff1d(_flat_in_bounds(free_cells, grid.shape), occupied_idx)
+
+    # The indices are unique and disjoint, so one fancy-indexed add applies every update
+    idx = np.concatenate([free_idx, occupied_idx])
+    updates = np.concatenate([np.full(len(free_idx), params.free), np.full(len(occupied_idx), params.occupied)])
+    cell_idx = np.unravel_index(idx, grid.shape)
+    grid[cell_idx] = np.clip(grid[cell_idx] + updates, params.min, params.max)
+
+    return grid
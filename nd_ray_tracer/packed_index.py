@@ -0,0 +1,60 @@
+import numpy as np
+from typing import List
+
+class PackedObstacleIndex:
+    """
+    Sparse obstacle index that packs each n-D cell into a single int64 key.
+    Every dimension gets a bit field of 63 // n bits holding its biased coordinate, so the key is a
+    bounded linear index: key = Σ (c_i + bias) * 2^(bits * i).
+    Keys are kept sorted, so batches of cells are looked up with np.searchsorted.
+    Supports `cell in index`, so it can be passed as `obstacles` to NDRayTracer.traverse.
+    """
+
+    def __init__(self, cells: List[np.ndarray], n: int):
+        self.n = n
+        self.bits = 63 // n
+        self.bias = 1 << (self.bits - 1)
+        self.strides = np.array([1 << (self.bits * i) for i in range(n)], dtype=np.int64)
+
+        cells = np.asarray(cells, dtype=np.int64).reshape(-1, n)
+        if not np.all(self.in_range(cells)):
+            raise ValueError(f"cell coordinates must lie in [{-self.bias}, {self.bias}) for {n} dimensions")
+        self.keys = np.unique(self.encode(cells))
+
+    def in_range(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each cell whose coordinates fit in the key's bit fields.
+        """
+        return np.all((cells >= -self.bias) & (cells < self.bias), axis=-1)
+
+    def encode(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Packs cells of shape (..., n) into int64 keys. Cells must be in range.
+        """
+        return ((np.asarray(cells, dtype=np.int64) + self.bias) * self.strides).sum(axis=-1)
+
+    def contains_keys(self, keys: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each key that belongs to an obstacle.
+        """
+        keys = np.asarray(keys, dtype=np.int64)
+        if not len(self.keys):
+            return np.zeros(keys.shape, dtype=bool)
+        idx = np.minimum(np.searchsorted(self.keys, keys), len(self.keys) - 1)
+        return self.keys[idx] == keys
+
+    def contains_cells(self, cells: np.ndarray) -> np.ndarray:
+        """
+        Returns True for each cell of shape (..., n) that is an obstacle. Out-of-range cells are free.
+        """
+        cells = np.asarray(cells, dtype=np.int64)
+        in_range = self.in_range(cells)
+        result = np.zeros(in_range.shape, dtype=bool)
+        result[in_range] = self.contains_keys(self.encode(cells[in_range]))
+        return result
+
+    def __contains__(self, cell) -> bool:
+        return bool(self.contains_cells(np.array([cell]))[0])
+
+    def __len__(self) -> int:
+        return len(self.keys)
@@ -0,0 +1,90 @@
+import numpy as np
+from typing import List, Tuple
+
+# Obstacle primitives rasterized into boolean occupancy grids.
+# Cell c covers [c, c + 1) in every dimension and is occupied if its centre c + 0.5 lies inside
+# the primitive. Boxes, balls and capsules only evaluate the cells in their bounding box; convex
+# polytopes have no cheap bounding box and evaluate the whole grid. The grids can be passed
+# directly as `obstacles` to NDRayTracer.traverse.
+
+def _bounding_box(shape: Tuple[int, ...], lo: np.ndarray, hi: np.ndarray) -> Tuple[Tuple[slice, ...], List[np.ndarray]]:
+    """
+    Returns the slices of the cells whose centres lie in [lo, hi] (clipped to the grid) and the
+    centre coordinates of those cells as open-mesh arrays that broadcast to the slice shape.
+    """
+    start = np.clip(np.ceil(np.asarray(lo, dtype=float) - 0.5).astype(int), 0, shape)
+    stop = np.clip(np.floor(np.asarray(hi, dtype=float) - 0.5).astype(int) + 1, 0, shape)
+    stop = np.maximum(stop, start)
+    box = tuple(slice(a, b) for a, b in zip(start, stop))
+    centres = [c + 0.5 for c in np.ogrid[box]]
+    return box, centres
+
+def box(shape: Tuple[int, ...], lo: np.ndarray, hi: np.ndarray) -> np.ndarray:
+    """
+    Axis-aligned box with corners lo and hi.
+    """
+    grid = np.zeros(shape, dtype=bool)
+    region, _ = _bounding_box(shape, lo, hi)
+    grid[region] = True
+    return grid
+
+def ball(shape: Tuple[int, ...], center: np.ndarray, radius: float) -> np.ndarray:
+    """
+    Ball of the given radius around center.
+    """
+    center = np.asarray(center, dtype=float)
+    grid = np.zeros(shape, dtype=bool)
+    region, centres = _bounding_box(shape, center - radius, center + radius)
+    squared_distance = sum((c - x) ** 2 for c, x in zip(centres, center))
+    grid[region] = squared_distance <= radius ** 2
+    return grid
+
+def convex_polytope(shape: Tuple[int, ...], A: np.ndarray, b: np.ndarray) -> np.ndarray:
+    """
+    Intersection of the half-spaces A x <= b, one row of A and entry of b per half-space.
+    Evaluated over the whole grid, one half-space at a time.
+    """
+    A = np.atleast_2d(np.asarray(A, dtype=float))
+    b = np.atleast_1d(np.asarray(b, dtype=float))
+    if A.shape != (len(b), len(shape)):
+        raise ValueError("A must have one row per entry of b and one column per dimension")
+
+    _, centres = _bounding_box(shape, np.zeros(len(shape)), np.array(shape, dtype=float))
+    inside = np.ones(shape, dtype=bool)
+    for a_j, b_j in zip(A, b):
+        inside &= sum(a * c for a, c in zip(a_j, centres)) <= b_j
+    return inside
+
+def capsule(shape: Tuple[int, ...], p_0: np.ndarray, p_1: np.ndarray, radius: float) -> np.ndarray:
+    """
+    All points within radius of the segment from p_0 to p_1.
+    """
+    p_0 = np.asarray(p_0, dtype=float)
+    p_1 = np.asarray(p_1, dtype=float)
+    grid = np.zeros(shape, dtype=bool)
+    region, centres = _bounding_box(shape, np.minimum(p_0, p_1) - radius, np.maximum(p_0, p_1) + radius)
+
+    # Parameter of the closest point on the segment, clamped to [0, 1]
+    axis = p_1 - p_0
+    axis_length_sq = axis @ axis
+    if axis_length_sq == 0:
+        t = 0.0
+    else:
+        t = np.clip(sum((c - p) * a for c, p, a in zip(centres, p_0, axis)) / axis_length_sq, 0.0, 1.0)
+    squared_distance = sum((c - (p + t * a)) ** 2 for c, p, a in zip(centres, p_0, axis))
+    grid[region] = squared_distance <= radius ** 2
+    return grid
+
+def union(*grids: np.ndarray) -> np.ndarray:
+    """
+    Cells occupied in any of the grids.
+    """
+    return np.logical_or.reduce(grids)
+
+def subtract(grid: np.ndarray, *others: np.ndarray) -> np.ndarray:
+    """
+    Cells occupied in grid but in none of the others.
+    """
+    if not others:
+        return grid.copy()
+    return grid & ~union(*others)
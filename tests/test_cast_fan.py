@@ -0,0 +1,91 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer
+
+def _first_occupied_by_sampling(origin, direction, max_range, grid, step=1e-3):
+    """
+    Brute force: walks the ray in tiny steps and returns the first occupied cell and its entry distance.
+    """
+    direction = direction / np.linalg.norm(direction)
+    for s in np.arange(0.0, max_range, step):
+        cell = np.floor(origin + s * direction).astype(int)
+        if np.all((cell >= 0) & (cell < grid.shape)) and grid[tuple(cell)]:
+            return s, cell
+    return float('inf'), None
+
+def test_axis_aligned_hit_and_miss():
+    grid = np.zeros((8, 8), dtype=bool)
+    grid[3, 1] = True
+    distances, cells, hit = NDRayTracer().cast_fan([0.5, 1.5], [[1, 0], [0, 1], [-1, 0]], 10, grid)
+
+    assert hit.tolist() == [True, False, False]
+    assert distances[0] == pytest.approx(2.5)
+    assert cells[0].tolist() == [3, 1]
+    assert np.isinf(distances[1:]).all()
+    assert (cells[1:] == -1).all()
+
+def test_origin_in_obstacle_hits_at_zero():
+    grid = np.zeros((4, 4), dtype=bool)
+    grid[1, 1] = True
+    distances, cells, hit = NDRayTracer().cast_fan([1.5, 1.5], [[1, 0], [0, -1]], 10, grid)
+
+    assert hit.all()
+    assert distances.tolist() == [0.0, 0.0]
+    assert cells.tolist() == [[1, 1], [1, 1]]
+
+def test_ray_along_grid_line_needs_both_sides_blocked():
+    grid = np.zeros((8, 8), dtype=bool)
+    grid[3, 1] = True
+    _, _, hit = NDRayTracer().cast_fan([1, 1], [[1, 0]], 10, grid)
+    assert not hit[0]
+
+    grid[3, 0] = True
+    distances, _, hit = NDRayTracer().cast_fan([1, 1], [[1, 0]], 10, grid)
+    assert hit[0]
+    assert distances[0] == pytest.approx(2.0)
+
+def test_ray_is_cut_at_max_range():
+    grid = np.zeros((10, 3), dtype=bool)
+    grid[6, 1] = True
+    _, _, hit = NDRayTracer().cast_fan([0.5, 1.5], [[1, 0]], 5.0, grid)
+    assert not hit[0]
+    _, _, hit = NDRayTracer().cast_fan([0.5, 1.5], [[1, 0]], 6.0, grid)
+    assert hit[0]
+
+def test_matches_brute_force_sampling_3d():
+    rng = np.random.default_rng(0)
+    grid = rng.random((10, 10, 10)) < 0.05
+    origin = np.array([5.3, 4.6, 5.1])
+    grid[tuple(np.floor(origin).astype(int))] = False
+    directions = rng.normal(size=(20, 3))
+    max_range = 8.0
+
+    distances, cells, hit = NDRayTracer().cast_fan(origin, directions, max_range, grid)
+
+    for i, direction in enumerate(directions):
+        expected_distance, expected_cell = _first_occupied_by_sampling(origin, direction, max_range, grid)
+        if expected_cell is None:
+            assert not hit[i]
+        else:
+            assert hit[i]
+            assert cells[i].tolist() == expected_cell.tolist()
+            assert distances[i] == pytest.approx(expected_distance, abs=2e-3)
+
+def test_batch_matches_single_rays():
+    rng = np.random.default_rng(1)
+    grid = rng.random((12, 12)) < 0.1
+    origin = np.array([6.2, 5.7])
+    directions = rng.normal(size=(25, 2))
+
+    tracer = NDRayTracer()
+    batch = tracer.cast_fan(origin, directions, 9.0, grid)
+    for i, direction in enumerate(directions):
+        single = tracer.cast_fan(origin, [direction], 9.0, grid)
+        assert single[0][0] == batch[0][i]
+        assert single[1][0].tolist() == batch[1][i].tolist()
+        assert single[2][0] == batch[2][i]
+
+def test_zero_direction_is_rejected():
+    with pytest.raises(ValueError):
+        NDRayTracer().cast_fan([0.5, 0.5], [[0, 0]], 5, np.zeros((2, 2), dtype=bool))
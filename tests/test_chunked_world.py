@@ -0,0 +1,99 @@
+import os
+
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer, ChunkedOccupancyStore
+
+CHUNK_SHAPE = (4, 4)
+CHUNK_BYTES = 16  # A 4x4 boolean chunk
+
+def _chunk_with(*cells):
+    chunk = np.zeros(CHUNK_SHAPE, dtype=bool)
+    for cell in cells:
+        chunk[cell] = True
+    return chunk
+
+def test_lookups_and_load_count(tmp_path):
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=10 * CHUNK_BYTES)
+    store.save_chunk((0, 0), _chunk_with((1, 2)))
+    store.save_chunk((-1, 1), _chunk_with((3, 0)))
+
+    assert (1, 2) in store
+    assert (1, 3) not in store
+    assert (-1, 4) in store
+    assert (-1, 5) not in store
+    assert store.load_count == 2
+    assert store.eviction_count == 0
+    assert store.loaded_chunks == 2
+
+def test_empty_chunks_are_never_loaded(tmp_path):
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=10 * CHUNK_BYTES)
+    store.save_chunk((0, 0), _chunk_with((0, 0)))
+
+    for cell in [(5, 5), (-3, 2), (100, -100)]:
+        assert cell not in store
+    assert store.load_count == 0
+    assert store.loaded_chunks == 0
+    assert store.memory_used == 0
+
+def test_saving_an_empty_chunk_removes_it(tmp_path):
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=10 * CHUNK_BYTES)
+    store.save_chunk((0, 0), _chunk_with((0, 0)))
+    store.save_chunk((0, 0), _chunk_with())
+
+    assert not store
+    assert (0, 0) not in store
+    assert os.listdir(tmp_path) == []
+
+def test_lru_eviction_under_budget(tmp_path):
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=2 * CHUNK_BYTES)
+    for key in [(0, 0), (1, 0), (2, 0)]:
+        store.save_chunk(key, _chunk_with((0, 0)))
+
+    assert (0, 0) in store    # loads (0, 0)
+    assert (4, 0) in store    # loads (1, 0)
+    assert (0, 0) in store    # hit, (0, 0) becomes most recently used
+    assert (8, 0) in store    # loads (2, 0), evicts (1, 0)
+    assert store.load_count == 3
+    assert store.eviction_count == 1
+    assert store.memory_used <= store.memory_budget
+
+    assert (0, 0) in store    # still loaded
+    assert store.load_count == 3
+    assert (4, 0) in store    # paged in again, evicts (2, 0)
+    assert store.load_count == 4
+    assert store.eviction_count == 2
+
+def test_reopened_store_finds_saved_chunks(tmp_path):
+    ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=CHUNK_BYTES).save_chunk((-2, 3), _chunk_with((1, 1)))
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=CHUNK_BYTES)
+
+    assert (-7, 13) in store
+    assert store.load_count == 1
+
+def test_wrong_chunk_shape_is_rejected(tmp_path):
+    store = ChunkedOccupancyStore(str(tmp_path), CHUNK_SHAPE, memory_budget=CHUNK_BYTES)
+    with pytest.raises(ValueError):
+        store.save_chunk((0, 0), np.ones((2, 2), dtype=bool))
+
+def test_traverse_matches_obstacle_list_and_only_loads_crossed_chunks(tmp_path):
+    obstacles = [np.array(c) for c in [[1, 1, 3], [1, 2, 3], [1, 3, 3], [1, 4, 3], [2, 1, 2], [2, 2, 2],
+                                       [2, 3, 2], [2, 4, 2], [2, 2, 3], [1, 3, 2], [30, 30, 30]]]
+    store = ChunkedOccupancyStore(str(tmp_path), (2, 2, 2), memory_budget=2 * 8)
+    chunks = {}
+    for obstacle in obstacles:
+        key = tuple(obstacle // 2)
+        chunks.setdefault(key, np.zeros((2, 2, 2), dtype=bool))[tuple(obstacle % 2)] = True
+    for key, chunk in chunks.items():
+        store.save_chunk(key, chunk)
+
+    x_0, x_f = np.array([2, 0, 3]), np.array([2, 5, 3])
+    expected = NDRayTracer().traverse(x_0, x_f, obstacles, loose_dimension=2)
+    result = NDRayTracer().traverse(x_0, x_f, store, loose_dimension=2)
+
+    assert result[4:] == expected[4:] == (True, False)
+    assert len(result[0]) == len(expected[0])
+    assert store.load_count > 0
+    assert (15, 15, 15) not in store._chunks
+    assert store.memory_used <= store.memory_budget
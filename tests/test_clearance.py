@@ -0,0 +1,128 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer, ClearanceField, distance_transform
+
+def _brute_force_distance(occupancy, max_distance, metric):
+    obstacles = np.argwhere(occupancy)
+    cells = np.indices(occupancy.shape).reshape(occupancy.ndim, -1).T
+    if not len(obstacles):
+        return np.full(occupancy.shape, float(max_distance))
+    # Per-axis gap between the cell centre and the nearest point of the obstacle cell
+    diff = np.maximum(np.abs(cells[:, None, :] - obstacles[None, :, :]) - 0.5, 0.0)
+    if metric == "euclidean":
+        distance = np.sqrt((diff ** 2).sum(axis=-1))
+    else:
+        distance = diff.max(axis=-1)
+    return np.minimum(distance.min(axis=1), max_distance).reshape(occupancy.shape)
+
+@pytest.mark.parametrize("metric", ["euclidean", "chebyshev"])
+@pytest.mark.parametrize("shape", [(40,), (20, 15), (12, 10, 9)])
+def test_distance_transform_matches_brute_force(metric, shape):
+    occupancy = np.random.default_rng(0).random(shape) < 0.05
+    result = distance_transform(occupancy, 4.0, metric)
+    assert np.allclose(result, _brute_force_distance(occupancy, 4.0, metric))
+
+@pytest.mark.parametrize("metric", ["euclidean", "chebyshev"])
+def test_incremental_update_equals_full_rebuild(metric):
+    rng = np.random.default_rng(1)
+    field = ClearanceField(rng.random((25, 20, 15)) < 0.03, 3.5, metric)
+
+    for _ in range(10):
+        cells = rng.integers(0, 15, size=(int(rng.integers(1, 4)), 3))
+        field.update(cells, occupied=bool(rng.random() < 0.5))
+        rebuilt = distance_transform(field.occupancy, field.max_clearance, metric)
+        assert np.array_equal(field.clearance, rebuilt)
+        assert field.has_obstacles == bool(field.occupancy.any())
+
+def test_obstacle_flag_follows_updates():
+    field = ClearanceField(np.zeros((6, 6), dtype=bool), 3.0)
+    assert not field.inflated(1.0)
+
+    field.update([[2, 2], [2, 2], [3, 3]], occupied=True)
+    assert field.inflated(1.0)
+    field.update([[2, 2]], occupied=False)
+    assert field.inflated(1.0)
+    field.update([[3, 3], [4, 4]], occupied=False)
+    assert not field.inflated(1.0)
+
+def test_inflated_lookup():
+    occupancy = np.zeros((10, 10), dtype=bool)
+    occupancy[5, 3] = True
+    inflated = ClearanceField(occupancy, 3.0, "chebyshev").inflated(1.0)
+
+    assert (5, 3) in inflated
+    assert (6, 4) in inflated
+    assert (5, 5) not in inflated
+    assert (-1, 3) not in inflated
+
+def test_euclidean_diagonal_overlap_is_rejected():
+    occupancy = np.zeros((6, 6), dtype=bool)
+    occupancy[2, 2] = True
+    field = ClearanceField(occupancy, 3.0, "euclidean")
+
+    # The diagonal neighbour's centre is sqrt(0.5) ~ 0.707 from the obstacle's corner
+    assert field.clearance[3, 3] == pytest.approx(np.sqrt(0.5))
+    assert (3, 3) in field.inflated(0.8)
+    assert (3, 3) not in field.inflated(0.7)
+    assert (3, 2) in field.inflated(0.6)
+    assert (3, 2) not in field.inflated(0.5)
+
+def test_zero_radius_only_blocks_occupied_cells():
+    occupancy = np.zeros((6, 6), dtype=bool)
+    occupancy[2, 2] = True
+    inflated = ClearanceField(occupancy, 2.0).inflated(0.0)
+
+    assert (2, 2) in inflated
+    assert (2, 3) not in inflated
+    assert (3, 3) not in inflated
+
+def test_radius_must_fit_the_field():
+    field = ClearanceField(np.zeros((4, 4), dtype=bool), 2.0)
+    field.inflated(2.0)
+    with pytest.raises(ValueError):
+        field.inflated(2.1)
+    with pytest.raises(ValueError):
+        field.inflated(-1.0)
+
+def test_traverse_with_clearance():
+    occupancy = np.zeros((10, 10), dtype=bool)
+    occupancy[5, 3] = True
+    field = ClearanceField(occupancy, 3.0, "chebyshev")
+    x_0, x_f = np.array([0.5, 5.5]), np.array([9.5, 5.5])
+
+    tracer = NDRayTracer()
+    assert tracer.traverse_with_clearance(x_0, x_f, field, 1.0, loose_dimension=1)[4:] == (False, True)
+    assert tracer.traverse_with_clearance(x_0, x_f, field, 2.0, loose_dimension=1)[4:] == (True, False)
+
+    # Same result as inflating the obstacle list by hand
+    inflated = [np.array(c) for c in np.argwhere(field.clearance < 2.0)]
+    assert NDRayTracer().traverse(x_0, x_f, inflated, loose_dimension=1)[4:] == (True, False)
+
+def test_update_with_no_cells_is_a_no_op():
+    occupancy = np.zeros((6, 6), dtype=bool)
+    occupancy[2, 2] = True
+    field = ClearanceField(occupancy, 3.0)
+    before = field.clearance.copy()
+
+    field.update([])
+    field.update(np.zeros((0, 2), dtype=int), occupied=False)
+
+    assert np.array_equal(field.clearance, before)
+    assert field.has_obstacles
+
+def test_update_that_changes_nothing_keeps_the_field():
+    occupancy = np.zeros((30, 30), dtype=bool)
+    occupancy[2, 2] = True
+    occupancy[29, 29] = True
+    field = ClearanceField(occupancy, 3.0)
+    field.clearance[20, 20] = -1.0  # Marker: untouched unless the region is recomputed
+
+    field.update([[2, 2], [29, 29]], occupied=True)
+    field.update([[25, 25]], occupied=False)
+    assert field.clearance[20, 20] == -1.0
+
+    # A no-op cell far away does not widen the region recomputed for a real change
+    field.update([[2, 3], [29, 29]], occupied=True)
+    assert field.clearance[20, 20] == -1.0
+    assert field.clearance[2, 3] == 0.0
@@ -0,0 +1,69 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer
+
+A = np.array
+
+# (label, x_0, x_f, obstacles, expected (obstacle_hit, goal_reached, len(path)) for loose_dimension 1..n)
+KNOWN_OUTCOMES = [
+    ("Ray along Y-axis with obstacles", A([2, 0, 3]), A([2, 5, 3]),
+     [A([1, 1, 3]), A([1, 2, 3]), A([1, 3, 3]), A([1, 4, 3]), A([2, 1, 2]), A([2, 2, 2]), A([2, 3, 2]), A([2, 4, 2]), A([2, 2, 3]), A([1, 3, 2])],
+     [(True, False, 4), (True, False, 4), (False, True, 6)]),
+    ("Surrounded Obstacle (3 cells)", A([0, 0, 0]), A([4, 4, 4]), [A([2, 1, 2]), A([1, 2, 2]), A([2, 2, 1])],
+     [(True, False, 3), (False, True, 5), (False, True, 5)]),
+    ("Surrounded Obstacle (6 cells)", A([0, 0, 0]), A([4, 4, 4]),
+     [A([1, 1, 2]), A([1, 2, 1]), A([2, 1, 1]), A([2, 1, 2]), A([1, 2, 2]), A([2, 2, 1])],
+     [(True, False, 3), (True, False, 3), (False, True, 5)]),
+    ("1D Change (X-axis)", A([0, 0, 0]), A([0, 4, 4]), [A([-1, 1, 2]), A([0, 1, 2]), A([-1, 2, 1]), A([0, 2, 1])],
+     [(True, False, 3), (False, True, 5), (False, True, 5)]),
+    ("End at Goal which is Obstacle", A([1, 1]), A([3, 3]), [A([3, 3])],
+     [(False, True, 3), (False, True, 3)]),
+    ("Start at Obstacle", A([1, 1]), A([5, 5]), [A([1, 1])],
+     [(True, False, 1), (True, False, 1)]),
+    ("Corner squeeze at start", A([0, 0]), A([4, 4]), [A([0, 1]), A([1, 0])],
+     [(True, False, 2), (False, True, 5)]),
+    ("Corner squeeze on the way", A([0, 0]), A([4, 4]), [A([1, 2]), A([2, 1])],
+     [(True, False, 3), (False, True, 5)]),
+    ("Negative 2D hit", A([-4.5, -3.5]), A([-0.5, -0.5]), [A([-2, -2])],
+     [(True, False, 6), (True, False, 6)]),
+    ("Negative 2D miss", A([-4.5, -3.5]), A([-0.5, -0.5]), [A([-2, -3])],
+     [(False, True, 9), (False, True, 9)]),
+    ("Negative 3D axis-aligned", A([-4.5, -1.5, -2.5]), A([-0.5, -1.5, -2.5]), [A([-3, -2, -3])],
+     [(True, False, 3), (True, False, 3), (True, False, 3)]),
+    ("Negative 3D oblique", A([-3.2, -1.5, -2.7]), A([1.4, -4.6, 0.3]),
+     [A([-1, -3, -1]), A([-2, -3, -2]), A([-1, -2, -1]), A([-2, -2, -2]), A([-2, -2, -1]), A([-1, -3, -2])],
+     [(True, False, 5), (True, False, 5), (True, False, 5)]),
+    ("4D diagonal", A([0, 0, 0, 0]), A([3, 3, 3, 3]), [A([1, 1, 1, 2]), A([1, 1, 2, 1]), A([1, 2, 1, 1]), A([2, 1, 1, 1])],
+     [(True, False, 3), (False, True, 4), (False, True, 4), (False, True, 4)]),
+]
+
+@pytest.mark.parametrize("label, x_0, x_f, obstacles, expected", KNOWN_OUTCOMES, ids=[case[0] for case in KNOWN_OUTCOMES])
+def test_known_outcomes_for_every_loose_dimension(label, x_0, x_f, obstacles, expected):
+    for loose_dimension, (obstacle_hit, goal_reached, path_length) in enumerate(expected, start=1):
+        path, _, _, _, hit, reached = NDRayTracer().traverse(x_0, x_f, obstacles, loose_dimension=loose_dimension)
+        assert (hit, reached, len(path)) == (obstacle_hit, goal_reached, path_length), loose_dimension
+
+@pytest.mark.parametrize("label, x_0, x_f, obstacles, expected", KNOWN_OUTCOMES, ids=[case[0] for case in KNOWN_OUTCOMES])
+def test_obstacle_containers_agree(label, x_0, x_f, obstacles, expected):
+    as_set = {tuple(obstacle) for obstacle in obstacles}
+    for loose_dimension in range(1, len(x_0) + 1):
+        from_list = NDRayTracer().traverse(x_0, x_f, obstacles, loose_dimension=loose_dimension)
+        from_set = NDRayTracer().traverse(x_0, x_f, as_set, loose_dimension=loose_dimension)
+        assert from_list[4:] == from_set[4:]
+        assert len(from_list[0]) == len(from_set[0])
+
+def test_is_hit_obstacle_tracks_front_cell_status():
+    tracer = NDRayTracer()
+    tracer.init(A([0.5, 0.5]), A([4.5, 0.5]))
+
+    assert not tracer.isHitObstacle([A([0, 0])], [A([1, 0])], [A([1, 1])], loose_dimension=1)
+    assert tracer.current_front_cell_status.tolist() == [1]
+    assert tracer.isHitObstacle([A([1, 0])], [A([2, 0])], [A([2, 0])], loose_dimension=1)
+    assert tracer.current_front_cell_status.tolist() == [0]
+
+def test_invalid_loose_dimension_is_rejected_when_a_move_is_needed():
+    with pytest.raises(ValueError):
+        NDRayTracer().traverse(A([0.5, 0.5]), A([4.5, 4.5]), [A([3, 0])], loose_dimension=0)
+    with pytest.raises(ValueError):
+        NDRayTracer().traverse(A([0.5, 0.5]), A([4.5, 4.5]), [A([3, 0])], loose_dimension=3)
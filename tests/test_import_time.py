@@ -0,0 +1,35 @@
+import json
+import subprocess
+import sys
+
+# Generous enough for a cold interpreter on a slow CI machine, far below a matplotlib import.
+IMPORT_TIME_BUDGET = 1.0
+
+def _import_in_fresh_interpreter(statement):
+    code = (
+        "import sys, time, json\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        "print(json.dumps({'elapsed': elapsed, 'modules': sorted(sys.modules)}))\n"
+    )
+    output = subprocess.run([sys.executable, "-c", code], check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+def test_package_import_does_not_load_matplotlib():
+    result = _import_in_fresh_interpreter("import nd_ray_tracer")
+    assert not [m for m in result["modules"] if m.split(".")[0] in ("matplotlib", "mpl_toolkits")]
+    assert "nd_ray_tracer.plotting" not in result["modules"]
+
+def test_star_import_does_not_load_matplotlib():
+    result = _import_in_fresh_interpreter("from nd_ray_tracer import *")
+    assert not [m for m in result["modules"] if m.split(".")[0] in ("matplotlib", "mpl_toolkits")]
+    assert "nd_ray_tracer.plotting" not in result["modules"]
+
+def test_cli_import_does_not_load_matplotlib():
+    result = _import_in_fresh_interpreter("import nd_ray_tracer.cli")
+    assert not [m for m in result["modules"] if m.split(".")[0] in ("matplotlib", "mpl_toolkits")]
+
+def test_package_import_time_within_budget():
+    result = _import_in_fresh_interpreter("import nd_ray_tracer")
+    assert result["elapsed"] < IMPORT_TIME_BUDGET
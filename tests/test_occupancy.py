@@ -0,0 +1,90 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer, LogOddsParams, integrate_rays
+
+def _cells_by_sampling(origin, endpoint, step=1e-3):
+    """
+    Brute force: the cells a segment passes through, in order, found by walking it in tiny steps.
+    """
+    cells = []
+    for s in np.arange(0.0, 1.0 + step, step):
+        cell = tuple(np.floor(origin + min(s, 1.0) * (endpoint - origin)).astype(int))
+        if not cells or cells[-1] != cell:
+            cells.append(cell)
+    return cells
+
+def test_batch_traversed_cells_matches_sampling():
+    rng = np.random.default_rng(0)
+    origins = rng.random((15, 3)) * 6
+    endpoints = rng.random((15, 3)) * 6
+
+    ray_indices, cells, end_cells = NDRayTracer().batch_traversed_cells(origins, endpoints)
+
+    for i in range(len(origins)):
+        expected = _cells_by_sampling(origins[i], endpoints[i])
+        assert [tuple(c) for c in cells[ray_indices == i].tolist()] == expected[:-1]
+        assert tuple(end_cells[i].tolist()) == expected[-1]
+
+def test_shared_origin_matches_per_ray_origins():
+    rng = np.random.default_rng(1)
+    origin = np.array([2.3, 3.7])
+    endpoints = rng.random((10, 2)) * 8
+
+    shared = NDRayTracer().batch_traversed_cells(origin, endpoints)
+    per_ray = NDRayTracer().batch_traversed_cells(np.tile(origin, (10, 1)), endpoints)
+    for a, b in zip(shared, per_ray):
+        assert np.array_equal(a, b)
+
+def test_free_and_occupied_updates():
+    params = LogOddsParams(free=-0.4, occupied=0.85, min=-2.0, max=3.5)
+    grid = np.zeros((6, 3))
+    integrate_rays([0.5, 1.5], [[4.5, 1.5]], grid, params)
+
+    assert grid[:4, 1] == pytest.approx([-0.4] * 4)
+    assert grid[4, 1] == pytest.approx(0.85)
+    assert np.count_nonzero(grid) == 5
+
+def test_cells_hit_by_many_rays_are_updated_once_per_batch():
+    grid = np.zeros((6, 3))
+    endpoints = np.array([[4.5, 1.5], [4.6, 1.5], [4.5, 1.6]])
+    integrate_rays([0.5, 1.5], endpoints, grid)
+
+    params = LogOddsParams()
+    assert grid[:4, 1] == pytest.approx([params.free] * 4)
+    assert grid[4, 1] == pytest.approx(params.occupied)
+
+def test_occupied_wins_over_free_in_the_same_batch():
+    grid = np.zeros((6, 3))
+    integrate_rays([0.5, 1.5], [[2.5, 1.5], [4.5, 1.5]], grid)
+
+    params = LogOddsParams()
+    assert grid[2, 1] == pytest.approx(params.occupied)
+    assert grid[3, 1] == pytest.approx(params.free)
+
+def test_updates_are_clamped():
+    params = LogOddsParams(free=-1.0, occupied=1.0, min=-2.5, max=2.5)
+    grid = np.zeros((4, 1))
+    for _ in range(5):
+        integrate_rays([0.5, 0.5], [[3.5, 0.5]], grid, params)
+
+    assert grid[:3, 0] == pytest.approx([-2.5] * 3)
+    assert grid[3, 0] == pytest.approx(2.5)
+
+def test_cells_outside_grid_are_ignored():
+    grid = np.zeros((3, 3))
+    integrate_rays([1.5, 1.5], [[8.5, 1.5]], grid)
+
+    assert grid[1:, 1] == pytest.approx([LogOddsParams().free] * 2)
+    assert np.count_nonzero(grid) == 2
+
+def test_integer_grid_is_rejected():
+    grid = np.zeros((6, 3), dtype=np.int8)
+    with pytest.raises(TypeError):
+        integrate_rays([0.5, 1.5], [[4.5, 1.5]], grid)
+    assert not grid.any()
+
+def test_float32_grid_is_accepted():
+    grid = np.zeros((6, 3), dtype=np.float32)
+    integrate_rays([0.5, 1.5], [[4.5, 1.5]], grid)
+    assert grid[4, 1] == pytest.approx(LogOddsParams().occupied)
@@ -0,0 +1,62 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer, PackedObstacleIndex
+
+def test_membership_with_negative_coordinates():
+    index = PackedObstacleIndex([[1, 2, 3], [-5, 0, 7], [1, 2, 3]], 3)
+
+    assert len(index) == 2
+    assert [1, 2, 3] in index
+    assert (-5, 0, 7) in index
+    assert (np.int64(-5), np.int64(0), np.int64(7)) in index
+    assert (0, 0, 0) not in index
+    assert (5, 0, -7) not in index
+
+def test_batch_lookup_matches_set():
+    rng = np.random.default_rng(0)
+    cells = rng.integers(-50, 50, size=(300, 4))
+    index = PackedObstacleIndex(cells, 4)
+    expected_set = {tuple(c) for c in cells.tolist()}
+
+    queries = rng.integers(-50, 50, size=(1000, 4))
+    expected = [tuple(q) in expected_set for q in queries.tolist()]
+    assert index.contains_cells(queries).tolist() == expected
+
+def test_keys_are_distinct_and_sorted():
+    cells = np.array([[x, y] for x in range(-3, 4) for y in range(-3, 4)])
+    index = PackedObstacleIndex(cells, 2)
+
+    assert len(index) == len(cells)
+    assert np.all(np.diff(index.keys) > 0)
+
+def test_out_of_range_queries_are_free():
+    index = PackedObstacleIndex([[0, 0, 0]], 3)
+
+    assert index.contains_cells(np.array([[0, 0, 0], [index.bias, 0, 0], [0, -index.bias - 1, 0]])).tolist() == [True, False, False]
+
+def test_out_of_range_cells_are_rejected():
+    index = PackedObstacleIndex([[0, 0, 0]], 3)
+    with pytest.raises(ValueError):
+        PackedObstacleIndex([[index.bias, 0, 0]], 3)
+
+def test_empty_index():
+    index = PackedObstacleIndex([], 2)
+
+    assert not index
+    assert (0, 0) not in index
+
+def test_tracer_falls_back_to_a_set_for_out_of_range_cells():
+    tracer = NDRayTracer()
+    bias = PackedObstacleIndex([], 3).bias
+
+    assert isinstance(tracer._as_obstacle_lookup([np.array([1, 2, 3])], 3), PackedObstacleIndex)
+    lookup = tracer._as_obstacle_lookup([np.array([1, 2, 3]), np.array([bias, 0, 0])], 3)
+    assert lookup == {(1, 2, 3), (bias, 0, 0)}
+
+def test_traverse_with_far_away_obstacles_uses_the_fallback():
+    bias = PackedObstacleIndex([], 2).bias
+    obstacles = [np.array([3, 0]), np.array([bias * 2, 0])]
+
+    result = NDRayTracer().traverse(np.array([0.5, 0.5]), np.array([6.5, 0.5]), obstacles, loose_dimension=1)
+    assert result[4:] == (True, False)
@@ -0,0 +1,117 @@
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer, OccupancyGridObstacles
+from nd_ray_tracer.primitives import ball, box, capsule, convex_polytope, subtract, union
+
+SHAPES = [(17,), (13, 11), (9, 8, 7)]
+
+def _centres(shape):
+    """
+    Centre coordinates of every cell, shape (*shape, n).
+    """
+    return np.stack(np.indices(shape), axis=-1) + 0.5
+
+def _point_segment_distance(points, p_0, p_1):
+    axis = p_1 - p_0
+    t = np.clip(((points - p_0) @ axis) / (axis @ axis), 0.0, 1.0) if axis @ axis else np.zeros(points.shape[:-1])
+    return np.linalg.norm(points - (p_0 + t[..., None] * axis), axis=-1)
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_box_matches_cell_centres(shape):
+    n = len(shape)
+    lo, hi = np.full(n, 1.3), np.array(shape) - 2.2
+    centres = _centres(shape)
+    expected = np.all((centres >= lo) & (centres <= hi), axis=-1)
+    assert np.array_equal(box(shape, lo, hi), expected)
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_ball_matches_cell_centres(shape):
+    center, radius = np.array(shape) / 2 - 0.3, min(shape) / 2.5
+    expected = np.linalg.norm(_centres(shape) - center, axis=-1) <= radius
+    assert np.array_equal(ball(shape, center, radius), expected)
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_ball_clipped_by_grid(shape):
+    center, radius = np.full(len(shape), -1.0), 4.2
+    expected = np.linalg.norm(_centres(shape) - center, axis=-1) <= radius
+    assert np.array_equal(ball(shape, center, radius), expected)
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_convex_polytope_matches_cell_centres(shape):
+    n = len(shape)
+    rng = np.random.default_rng(n)
+    A = rng.normal(size=(n + 2, n))
+    b = A @ (np.array(shape) / 2) + 2.0
+    expected = np.all(_centres(shape) @ A.T <= b, axis=-1)
+    assert np.array_equal(convex_polytope(shape, A, b), expected)
+
+@pytest.mark.parametrize("shape", SHAPES)
+def test_capsule_matches_cell_centres(shape):
+    p_0, p_1 = np.full(len(shape), 1.2), np.array(shape) - 1.7
+    radius = 1.6
+    expected = _point_segment_distance(_centres(shape), p_0, p_1) <= radius
+    assert np.array_equal(capsule(shape, p_0, p_1, radius), expected)
+
+def test_degenerate_capsule_is_a_ball():
+    shape = (12, 12)
+    assert np.array_equal(capsule(shape, [5.0, 6.0], [5.0, 6.0], 3.0), ball(shape, [5.0, 6.0], 3.0))
+
+def test_union_and_subtract():
+    shape = (10, 10)
+    a = box(shape, [0, 0], [6, 6])
+    b = ball(shape, [7, 7], 2.5)
+    c = box(shape, [2, 2], [4, 4])
+
+    assert np.array_equal(union(a, b), a | b)
+    assert np.array_equal(subtract(union(a, b), c), (a | b) & ~c)
+    assert np.array_equal(subtract(a), a)
+    assert subtract(a) is not a
+
+def test_polytope_shape_mismatch_is_rejected():
+    with pytest.raises(ValueError):
+        convex_polytope((4, 4), np.ones((2, 3)), np.ones(2))
+
+@pytest.mark.parametrize("x_0, x_f, loose_dimension", [
+    ([0.5, 0.5], [11.5, 11.5], 1),
+    ([5.5, 0.5], [5.5, 11.5], 1),
+    ([3.5, 0.5], [3.5, 11.5], 1),
+    ([0, 0], [11, 9], 2),
+    ([11.5, 11.5], [0.5, 2.5], 2),
+])
+def test_traverse_on_bool_grid_matches_cell_list(x_0, x_f, loose_dimension):
+    shape = (12, 12)
+    grid = subtract(union(box(shape, [0, 5], [12, 6]), ball(shape, [2, 2], 1.0), capsule(shape, [8, 1], [10, 3], 0.8)),
+                    box(shape, [5, 5], [6, 6]))
+    cells = [np.array(c) for c in np.argwhere(grid)]
+    x_0, x_f = np.array(x_0, dtype=float), np.array(x_f, dtype=float)
+
+    on_grid = NDRayTracer().traverse(x_0, x_f, grid, loose_dimension=loose_dimension)
+    on_list = NDRayTracer().traverse(x_0, x_f, cells, loose_dimension=loose_dimension)
+
+    assert on_grid[4:] == on_list[4:]
+    assert len(on_grid[0]) == len(on_list[0])
+    assert all(np.array_equal(a, b) for a, b in zip(on_grid[0], on_list[0]))
+
+@pytest.mark.parametrize("dtype", [np.uint8, int, float])
+def test_traverse_on_non_bool_grid_matches_bool_grid(dtype):
+    shape = (12, 12, 3)
+    grid = union(box(shape, [0, 5, 0], [12, 6, 3]), ball(shape, [2, 2, 1], 1.0))
+    x_0, x_f = np.array([0.5, 0.5, 1.5]), np.array([11.5, 11.5, 1.5])
+
+    on_bool = NDRayTracer().traverse(x_0, x_f, grid, loose_dimension=3)
+    on_numeric = NDRayTracer().traverse(x_0, x_f, grid.astype(dtype) * 3, loose_dimension=3)
+    on_list = NDRayTracer().traverse(x_0, x_f, np.argwhere(grid), loose_dimension=3)
+
+    assert on_bool[4] and on_numeric[4:] == on_bool[4:] == on_list[4:]
+    assert all(np.array_equal(a, b) for a, b in zip(on_numeric[0], on_bool[0]))
+
+def test_wrapped_two_column_grid_is_read_as_grid():
+    grid = np.zeros((12, 2), dtype=np.uint8)
+    grid[6, :] = 1
+    result = NDRayTracer().traverse(np.array([0.5, 0.5]), np.array([11.5, 1.5]), OccupancyGridObstacles(grid), loose_dimension=2)
+    assert result[4]
+
+def test_obstacle_array_of_wrong_rank_raises():
+    with pytest.raises(ValueError, match="occupancy grid"):
+        NDRayTracer().traverse(np.array([0.5, 0.5, 0.5]), np.array([4.5, 4.5, 4.5]), np.zeros((5, 5), dtype=np.uint8), loose_dimension=3)
@@ -0,0 +1,95 @@
+import time
+
+import numpy as np
+import pytest
+
+from nd_ray_tracer import NDRayTracer
+
+def assert_same_result(result, expected):
+    path, front_cells, intersections, y_history, hit, goal_reached = result
+    e_path, e_front_cells, e_intersections, e_y_history, e_hit, e_goal_reached = expected
+    assert (hit, goal_reached) == (e_hit, e_goal_reached)
+    assert len(path) == len(e_path) and all(np.array_equal(a, b) for a, b in zip(path, e_path))
+    assert len(intersections) == len(e_intersections)
+    assert all(np.array_equal(a, b) for a, b in zip(intersections, e_intersections))
+    assert len(y_history) == len(e_y_history) and all(np.array_equal(a, b) for a, b in zip(y_history, e_y_history))
+    assert len(front_cells) == len(e_front_cells)
+    for cells, e_cells in zip(front_cells, e_front_cells):
+        assert len(cells) == len(e_cells) and all(np.array_equal(a, b) for a, b in zip(cells, e_cells))
+
+RESUME_CASES = [
+    (np.array([1.2, 1.8]), np.array([25.7, 16.3]), [], 1),
+    (np.array([0.5, 0.5, 0.5]), np.array([14.5, 9.5, 11.5]), [np.array([7, 5, 6])], 2),
+    (np.array([2, 0, 3]), np.array([2, 5, 3]), [np.array([2, 2, 2]), np.array([1, 3, 3])], 1),
+    (np.array([1, 1]), np.array([20, 20]), [np.array([12, 12])], 1),
+]
+
+@pytest.mark.parametrize("x_0, x_f, obstacles, loose_dimension", RESUME_CASES)
+@pytest.mark.parametrize("max_steps", [1, 3, 10])
+def test_resumed_traversal_equals_uninterrupted(x_0, x_f, obstacles, loose_dimension, max_steps):
+    expected = NDRayTracer().traverse(x_0, x_f, obstacles, loose_dimension=loose_dimension)
+
+    result, checkpoint = NDRayTracer().traverse_budgeted(x_0, x_f, obstacles, loose_dimension=loose_dimension, max_steps=max_steps)
+    while checkpoint is not None:
+        # Resume on a fresh tracer each time, as a different frame or worker would
+        result, checkpoint = NDRayTracer().traverse_budgeted(None, None, obstacles, loose_dimension=loose_dimension,
+                                                             max_steps=max_steps, checkpoint=checkpoint)
+
+    assert_same_result(result, expected)
+
+def test_checkpoint_holds_only_the_dynamic_state_copy():
+    tracer = NDRayTracer()
+    _, checkpoint = tracer.traverse_budgeted(np.array([0.5, 0.5]), np.array([30.5, 20.5]), max_steps=5)
+
+    assert checkpoint.t == 5
+    assert checkpoint.result_lengths == (len(checkpoint.path), len(checkpoint.front_cells),
+                                         len(checkpoint.intersection_coords), len(checkpoint.y_coords_history))
+    # The dynamic state is a copy, the results are shared
+    assert checkpoint.k is not tracer.k and checkpoint.D is not tracer.D and checkpoint.y is not tracer.y
+    assert checkpoint.y_coords_history is tracer.y_coords_history
+
+def _snapshot(result):
+    return [list(r) for r in result[:4]] + list(result[4:])
+
+def test_resuming_an_older_checkpoint_again_gives_the_same_result():
+    x_0, x_f = np.array([0.5, 0.5]), np.array([12.5, 7.5])
+    expected = NDRayTracer().traverse(x_0, x_f)
+
+    _, checkpoint = NDRayTracer().traverse_budgeted(x_0, x_f, max_steps=4)
+    first, _ = NDRayTracer().traverse_budgeted(None, None, checkpoint=checkpoint)
+    second, _ = NDRayTracer().traverse_budgeted(None, None, checkpoint=checkpoint)
+
+    assert_same_result(first, expected)
+    assert_same_result(second, expected)
+
+@pytest.mark.parametrize("same_tracer", [False, True])
+def test_resuming_an_older_checkpoint_with_a_smaller_budget_leaves_earlier_results_unchanged(same_tracer):
+    x_0, x_f = np.array([0.5, 0.5]), np.array([12.5, 7.5])
+    expected = NDRayTracer().traverse(x_0, x_f)
+
+    tracer = NDRayTracer()
+    _, first_checkpoint = tracer.traverse_budgeted(x_0, x_f, max_steps=2)
+    finished, _ = (tracer if same_tracer else NDRayTracer()).traverse_budgeted(None, None, checkpoint=first_checkpoint)
+    finished_snapshot = _snapshot(finished)
+    assert_same_result(finished, expected)
+
+    result, checkpoint = (tracer if same_tracer else NDRayTracer()).traverse_budgeted(None, None, max_steps=1, checkpoint=first_checkpoint)
+    assert result is None
+    assert_same_result(finished, finished_snapshot)
+    while checkpoint is not None:
+        result, checkpoint = (tracer if same_tracer else NDRayTracer()).traverse_budgeted(None, None, max_steps=1, checkpoint=checkpoint)
+
+    assert_same_result(result, expected)
+    assert_same_result(finished, finished_snapshot)
+
+def test_expired_deadline_pauses_before_the_first_step():
+    result, checkpoint = NDRayTracer().traverse_budgeted(np.array([0.5, 0.5]), np.array([50.5, 40.5]), deadline=time.monotonic())
+
+    assert result is None
+    assert checkpoint.t == 0
+
+def test_no_budget_finishes_in_one_call():
+    result, checkpoint = NDRayTracer().traverse_budgeted(np.array([0.5, 0.5]), np.array([5.5, 4.5]))
+
+    assert checkpoint is None
+    assert result[4:] == (False, True)